@@ -19,12 +19,18 @@ Usage:
 
 Requires:
   pip install Pillow
+  pip install numpy   (optional — vectorized conversion)
+  pip install numba   (optional — parallel colored output for very large frames)
 """
 
 import argparse
+import functools
 import os
+import re
 import sys
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 
 try:
     from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter, ImageOps
@@ -32,6 +38,11 @@ except ImportError:
     print("Error: Pillow is not installed. Run: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None   # optional — the pure-Python converters are used instead
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -49,9 +60,21 @@ _CANDIDATE_CHARS = (
 # looking proportional in the terminal.
 CHAR_ASPECT_RATIO = 0.45
 
+# The same ratio as exact integers (0.45 → 9/20) so sizing needs no float math.
+_ASPECT_NUM, _ASPECT_DEN = Fraction(str(CHAR_ASPECT_RATIO)).as_integer_ratio()
+
 # Default output width in characters (fits most terminals without scrolling).
 DEFAULT_WIDTH = 100
 
+# Resampling filters selectable with --filter.  "auto" picks a cheaper filter
+# for large downscales, where the difference is invisible in ASCII output.
+RESAMPLE_FILTERS = {
+    "lanczos":  Image.LANCZOS,
+    "bilinear": Image.BILINEAR,
+    "box":      Image.BOX,
+}
+DEFAULT_FILTER = "lanczos"
+
 # Preprocessing strengths (1.0 = no change)
 CONTRAST_FACTOR  = 1.3   # gentler now that histogram EQ handles dynamic range
 SHARPNESS_FACTOR = 1.5   # gentler with edge overlay doing the heavy lifting
@@ -59,9 +82,25 @@ SHARPNESS_FACTOR = 1.5   # gentler with edge overlay doing the heavy lifting
 # Gamma correction for brightness mapping (< 1.0 = more shadow detail).
 GAMMA = 0.6
 
+# The gamma curve in 0.32 fixed point: entry v is floor((v / 255) ** GAMMA * 2**32).
+# Multiplying by (len(char_set) - 1) and shifting right gives the character
+# index without a divide or float math, exactly matching the float formula
+# for any character set of up to 256 entries.
+_GAMMA_BITS  = 32
+_GAMMA_TABLE = [int((v / 255.0) ** GAMMA * (1 << _GAMMA_BITS)) for v in range(256)]
+
 # Edge-overlay blend strength (0.0 = no edges, 1.0 = full edge image).
 EDGE_BLEND = 0.15
 
+# Minimum pixels per worker thread before colored rows are assembled in
+# parallel; smaller frames are faster on a single thread.
+PARALLEL_MIN_PIXELS = 1 << 16
+
+# Minimum pixels before colored rows use the optional Numba kernel.  Importing
+# numba and loading the compiled kernel takes a few hundred milliseconds, which
+# only pays off on very large frames.
+JIT_MIN_PIXELS = 1 << 22
+
 # Font size (pixels) used when rendering ASCII art to a JPG image.
 FONT_SIZE = 12
 
@@ -87,7 +126,7 @@ def _measure_char_density(char: str, font: "ImageFont.FreeTypeFont | ImageFont.I
     size = 20
     img = Image.new("L", (size, size), 0)
     ImageDraw.Draw(img).text((2, 2), char, fill=255, font=font)
-    pixels = list(img.getdata())
+    pixels = img.tobytes()   # one byte (already an int) per pixel
     return sum(1 for p in pixels if p > 30) / len(pixels)
 
 
@@ -113,6 +152,9 @@ def _build_density_ramp(candidates: str) -> str:
 # Build the ramp once at import time.
 DEFAULT_CHARS = _build_density_ramp(_CANDIDATE_CHARS)
 
+# Matches any ANSI SGR escape sequence (used to strip colors from rows).
+_ANSI_RE = re.compile(rb"\x1b\[[0-9;]*m")
+
 # Folder (relative to this script) where outputs are auto-saved.
 RECEIVED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "received")
 
@@ -166,7 +208,7 @@ def _load_mono_font() -> "ImageFont.FreeTypeFont | ImageFont.ImageFont":
     return ImageFont.load_default()
 
 
-def save_ascii_as_image(rows: list[str], output_path: str) -> None:
+def save_ascii_as_image(rows: "list[bytes] | list[str]", output_path: str) -> None:
     """
     Render the ASCII art rows onto a black JPG image.
 
@@ -176,15 +218,15 @@ def save_ascii_as_image(rows: list[str], output_path: str) -> None:
 
     Parameters
     ----------
-    rows : list[str]
+    rows : list[bytes] or list[str]
         Lines of ASCII characters (may contain ANSI escape codes).
     output_path : str
         Destination .jpg file path.
     """
-    import re
+    rows = [r.decode("utf-8") if isinstance(r, bytes) else r for r in rows]
 
     ansi_escape  = re.compile(r"\033\[[0-9;]*m")
-    color_pattern = re.compile(r"\033\[38;2;(\d+);(\d+);(\d+)m(.)\033\[0m")
+    sgr_pattern  = re.compile(r"\033\[([0-9;]*)m")
     has_color = any("\033" in row for row in rows)
 
     font     = _load_mono_font()
@@ -207,21 +249,21 @@ def save_ascii_as_image(rows: list[str], output_path: str) -> None:
 
         if has_color:
             # --- Draw character-by-character with original colors -----------
-            x   = padding
-            pos = 0
+            # A color code stays in effect until the next one (or a reset).
+            x    = padding
+            pos  = 0
+            fill = (200, 200, 200)
             while pos < len(row):
-                m = color_pattern.match(row, pos)
+                m = sgr_pattern.match(row, pos)
                 if m:
-                    r, g, b, char = int(m.group(1)), int(m.group(2)), int(m.group(3)), m.group(4)
-                    draw.text((x, y), char, fill=(r, g, b), font=font)
-                    x   += char_w
-                    pos  = m.end()
-                elif row[pos] == "\033":
-                    # Skip any remaining escape sequences
-                    end = row.find("m", pos)
-                    pos = end + 1 if end != -1 else pos + 1
+                    params = m.group(1).split(";")
+                    if params[:2] == ["38", "2"] and len(params) >= 5:
+                        fill = (int(params[2]), int(params[3]), int(params[4]))
+                    elif params in ([""], ["0"]):
+                        fill = (200, 200, 200)
+                    pos = m.end()
                 else:
-                    draw.text((x, y), row[pos], fill=(200, 200, 200), font=font)
+                    draw.text((x, y), row[pos], fill=fill, font=font)
                     x   += char_w
                     pos += 1
         else:
@@ -298,7 +340,7 @@ def preprocess_image(img: Image.Image) -> Image.Image:
     return img
 
 
-def load_image(path: str) -> Image.Image:
+def load_image(path: str, verify: bool = False) -> Image.Image:
     """
     Load an image from the given file path.
 
@@ -306,6 +348,10 @@ def load_image(path: str) -> Image.Image:
     ----------
     path : str
         Absolute or relative path to the image file.
+    verify : bool
+        Run Pillow's integrity check first.  This costs a second open and
+        header parse, so it is off by default; decoding errors are still
+        reported either way.
 
     Returns
     -------
@@ -322,16 +368,18 @@ def load_image(path: str) -> Image.Image:
         sys.exit(1)
 
     try:
+        if verify:
+            with Image.open(path) as check:
+                check.verify()     # Detect corrupt files early (consumes the object)
         img = Image.open(path)
-        img.verify()           # Detect corrupt files early
-        img = Image.open(path) # Re-open after verify (verify() consumes the object)
+        img.load()                 # Decode now so errors surface here
         return img
     except Exception as exc:
         print(f"Error: Could not open image — {exc}")
         sys.exit(1)
 
 
-def resize_image(img: Image.Image, target_width: int) -> Image.Image:
+def resize_image(img: Image.Image, target_width: int, resample: str = DEFAULT_FILTER) -> Image.Image:
     """
     Resize the image to `target_width` columns while preserving the aspect
     ratio and compensating for the terminal character aspect ratio.
@@ -342,6 +390,9 @@ def resize_image(img: Image.Image, target_width: int) -> Image.Image:
         The source image.
     target_width : int
         Desired number of ASCII columns.
+    resample : str
+        A key of RESAMPLE_FILTERS, or "auto" to choose by downscale ratio:
+        box above 8x, bilinear above 2x, lanczos otherwise.
 
     Returns
     -------
@@ -351,11 +402,24 @@ def resize_image(img: Image.Image, target_width: int) -> Image.Image:
     original_width, original_height = img.size
 
     # Calculate the height that maintains aspect ratio, adjusted for the
-    # fact that each character cell is taller than it is wide.
-    target_height = int(original_height * target_width / original_width * CHAR_ASPECT_RATIO)
-
-    # LANCZOS gives the best quality when downscaling
-    resized = img.resize((target_width, target_height), Image.LANCZOS)
+    # fact that each character cell is taller than it is wide.  At least one
+    # row is kept for extremely wide images.
+    target_height = (original_height * target_width * _ASPECT_NUM) // (original_width * _ASPECT_DEN)
+    target_height = max(1, target_height)
+
+    # LANCZOS gives the best quality when downscaling, but for big reductions
+    # "auto" trades it for fewer filter taps plus a cheap integer pre-reduce.
+    reducing_gap = None
+    if resample == "auto":
+        ratio = original_width / target_width
+        resample = "box" if ratio > 8 else "bilinear" if ratio > 2 else "lanczos"
+        reducing_gap = 3.0
+
+    resized = img.resize(
+        (target_width, target_height),
+        RESAMPLE_FILTERS[resample],
+        reducing_gap=reducing_gap,
+    )
     return resized
 
 
@@ -380,6 +444,9 @@ def pixel_to_ascii(pixel_value: int, char_set: str) -> str:
     """
     Map a single 8-bit grayscale pixel value (0–255) to an ASCII character.
 
+    The converters no longer call this per pixel — it defines the mapping
+    that `_build_char_lut` tabulates, and is kept for callers importing it.
+
     The mapping is linear:
       - 0   (black)  → first character in char_set  (typically the most dense)
       - 255 (white)  → last character in char_set   (typically a space)
@@ -404,35 +471,76 @@ def pixel_to_ascii(pixel_value: int, char_set: str) -> str:
     return char_set[min(index, len(char_set) - 1)]
 
 
-def image_to_ascii(gray_img: Image.Image, char_set: str) -> list[str]:
+@functools.lru_cache(maxsize=32)
+def _build_char_lut(char_set: str) -> "bytes | tuple[str, ...]":
+    """
+    Precompute the character for every possible 8-bit grayscale value.
+
+    Returns a 256-byte table where entry `v` is the ASCII code that
+    `pixel_to_ascii(v, char_set)` would produce, so conversion becomes a
+    single table lookup per pixel.  Non-ASCII character sets (e.g. block
+    characters) get a 256-tuple of the characters themselves instead.
+    Tables are cached per character set, so repeated conversions (e.g.
+    video frames) only build them once.
+    """
+    last = len(char_set) - 1
+    if last < 256:
+        # Fixed-point gamma curve: one multiply-shift per entry, exact here
+        chars = [char_set[(q * last) >> _GAMMA_BITS] for q in _GAMMA_TABLE]
+    else:
+        chars = [pixel_to_ascii(v, char_set) for v in range(256)]
+    if not char_set.isascii():
+        return tuple(chars)
+    return "".join(chars).encode("ascii")
+
+
+def _as_char_lut(char_set: "str | bytes | tuple[str, ...]") -> "bytes | tuple[str, ...]":
+    """Return `char_set` as a lookup table, building it if given a string."""
+    return _build_char_lut(char_set) if isinstance(char_set, str) else char_set
+
+
+def image_to_ascii(gray_img: Image.Image, char_set: "str | bytes | tuple[str, ...]") -> list[bytes]:
     """
     Convert every pixel of a grayscale image into its corresponding ASCII
-    character and return the result as a list of strings (one per row).
+    character and return the result as a list of byte strings (one per row).
 
     Parameters
     ----------
     gray_img : PIL.Image.Image
         Grayscale ('L' mode) image.
-    char_set : str
-        Ordered string of ASCII characters, darkest to lightest.
+    char_set : str, bytes or tuple
+        Ordered string of characters, darkest to lightest, or the lookup
+        table built from one by `_build_char_lut`.
 
     Returns
     -------
-    list[str]
-        Each element is one row of ASCII characters.
+    list[bytes]
+        Each element is one row of characters (UTF-8 for non-ASCII sets).
     """
+    char_lut = _as_char_lut(char_set)
     width, height = gray_img.size
-    pixels = list(gray_img.getdata())  # Convert to list to support slicing
+
+    if not isinstance(char_lut, bytes):
+        # Non-ASCII set: map the gray levels (as latin-1 code points) through
+        # the character table with str.translate, then encode each row
+        text = gray_img.tobytes().decode("latin-1").translate(char_lut)
+        return [text[start:start + width].encode("utf-8") for start in range(0, width * height, width)]
+
+    if np is not None:
+        # Vectorized path: one fancy-index gather maps every pixel at once
+        lut   = np.frombuffer(char_lut, dtype=np.uint8)
+        codes = lut[np.asarray(gray_img, dtype=np.uint8)]
+        return [row.tobytes() for row in codes]
+
+    # Pure-Python path: the raw 'L' bytes are one gray level per pixel, and
+    # bytes.translate maps them all through the lookup table in C
+    codes = gray_img.tobytes().translate(char_lut)
 
     rows = []
     for row_index in range(height):
         row_start = row_index * width
         row_end   = row_start + width
-        row_pixels = pixels[row_start:row_end]
-
-        # Convert every pixel in this row to an ASCII character
-        ascii_row = "".join(pixel_to_ascii(p, char_set) for p in row_pixels)
-        rows.append(ascii_row)
+        rows.append(codes[row_start:row_end])
 
     return rows
 
@@ -460,14 +568,155 @@ def make_ansi_color(r: int, g: int, b: int, text: str) -> str:
     return f"\033[38;2;{r};{g};{b}m{text}\033[0m"
 
 
+# Fixed-width layout of one colored character cell: the longest possible
+# "ESC[38;2;RRR;GGG;BBBm" + char + "ESC[0m".  Shorter numbers leave NUL bytes
+# in their digit slots, and escape codes that are not needed (repeated colors,
+# resets before the end of the row) are zeroed out too; all NULs are squeezed
+# out when the row is assembled.
+_SGR_PREFIX = b"\033[38;2;"
+_SGR_RESET  = b"\033[0m"
+_CELL_WIDTH = len(_SGR_PREFIX) + 3 * 4 + 1 + len(_SGR_RESET)
+
+# Decimal text of 0–255, so escape codes need no int-to-string conversion,
+# and the same digits left-aligned in NUL-padded 3-byte slots.
+_DEC        = [str(v).encode("ascii") for v in range(256)]
+_DEC_DIGITS = b"".join(digits.ljust(3, b"\0") for digits in _DEC)
+
+
+def _ansi_rows(codes: "np.ndarray", rgb: "np.ndarray") -> list[bytes]:
+    """
+    Assemble ANSI-colored rows from an (H, W) array of character codes and
+    the matching (H, W, 3) RGB array without any per-pixel Python work.
+
+    Every pixel is written into a fixed-width byte cell in one vectorized
+    pass per field; dropping the NUL padding then yields the variable-length
+    escape sequences.  A foreground code is only emitted where the color
+    differs from the previous pixel, and each row ends with a single reset.
+    """
+    height, width = codes.shape
+    digits = np.frombuffer(_DEC_DIGITS, dtype=np.uint8).reshape(256, 3)
+    prefix = len(_SGR_PREFIX)
+
+    cells = np.zeros((height, width, _CELL_WIDTH), dtype=np.uint8)
+    cells[..., :prefix] = np.frombuffer(_SGR_PREFIX, dtype=np.uint8)
+    for channel in range(3):
+        start = prefix + channel * 4
+        cells[..., start:start + 3] = digits[rgb[..., channel]]
+        cells[..., start + 3] = ord(";") if channel < 2 else ord("m")
+    cells[..., prefix + 12] = codes
+    cells[:, -1, prefix + 13:] = np.frombuffer(_SGR_RESET, dtype=np.uint8)
+
+    # Drop the color code wherever it repeats the previous pixel's color
+    same_color = np.zeros((height, width), dtype=bool)
+    same_color[:, 1:] = np.all(rgb[:, 1:] == rgb[:, :-1], axis=-1)
+    cells[same_color, :prefix + 12] = 0
+
+    cells = cells.reshape(height, -1)
+    keep  = cells != 0
+    text  = cells[keep].tobytes()
+    ends  = np.cumsum(keep.sum(axis=1)).tolist()
+    return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+def _ansi_rows_parallel(codes: "np.ndarray", rgb: "np.ndarray") -> list[bytes]:
+    """
+    Run `_ansi_rows` over horizontal bands of the image on a thread pool.
+
+    Rows are independent and NumPy releases the GIL inside the per-field
+    copies, so bands scale across cores.  Falls back to a single call when
+    the frame is too small to be worth splitting.
+    """
+    height = codes.shape[0]
+    workers = min(os.cpu_count() or 1, height, codes.size // PARALLEL_MIN_PIXELS)
+    if workers <= 1:
+        return _ansi_rows(codes, rgb)
+
+    bounds = [height * i // workers for i in range(workers + 1)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        bands = pool.map(
+            lambda start, end: _ansi_rows(codes[start:end], rgb[start:end]),
+            bounds[:-1], bounds[1:],
+        )
+        return [row for band in bands for row in band]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_colored_kernel():
+    """
+    Import numba and build the native colored-row kernel on first use.
+
+    Returns None when numba is not installed.  The compiled kernel is cached
+    on disk, so only the first run on a machine pays for compilation.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def render_colored(gray, rgb, char_lut, prefix, reset, stride, out, lengths):
+        """
+        Native row-parallel equivalent of `_ansi_rows`: row `y` is written
+        into `out[y * stride:]` and its length stored in `lengths[y]`.
+        """
+        height, width = gray.shape
+        for y in prange(height):
+            pos = y * stride
+            prev_r, prev_g, prev_b = -1, -1, -1
+            for x in range(width):
+                r, g, b = int(rgb[y, x, 0]), int(rgb[y, x, 1]), int(rgb[y, x, 2])
+                if r != prev_r or g != prev_g or b != prev_b:
+                    out[pos:pos + prefix.size] = prefix
+                    pos += prefix.size
+                    for channel in range(3):
+                        # 1–3 decimal digits, then ';' (or 'm' after blue)
+                        value = int(rgb[y, x, channel])
+                        if value >= 100:
+                            out[pos] = 48 + value // 100
+                            pos += 1
+                        if value >= 10:
+                            out[pos] = 48 + value // 10 % 10
+                            pos += 1
+                        out[pos] = 48 + value % 10
+                        out[pos + 1] = 59 if channel < 2 else 109
+                        pos += 2
+                    prev_r, prev_g, prev_b = r, g, b
+                out[pos] = char_lut[gray[y, x]]
+                pos += 1
+            out[pos:pos + reset.size] = reset
+            lengths[y] = pos + reset.size - y * stride
+
+    return render_colored
+
+
+def _ansi_rows_jit(kernel, gray: "np.ndarray", rgb: "np.ndarray", lut: "np.ndarray") -> list[bytes]:
+    """
+    Assemble ANSI-colored rows with the Numba `kernel`, using a preallocated
+    buffer sized for the worst case of a color code on every pixel.
+    """
+    height, width = gray.shape
+    stride  = width * (_CELL_WIDTH - len(_SGR_RESET)) + len(_SGR_RESET)
+    out     = np.empty(height * stride, dtype=np.uint8)
+    lengths = np.empty(height, dtype=np.int64)
+    kernel(
+        gray, rgb, lut,
+        np.frombuffer(_SGR_PREFIX, dtype=np.uint8),
+        np.frombuffer(_SGR_RESET, dtype=np.uint8),
+        stride, out, lengths,
+    )
+    return [out[y * stride:y * stride + n].tobytes() for y, n in enumerate(lengths.tolist())]
+
+
 def image_to_ascii_colored(
     original_img: Image.Image,
     gray_img: Image.Image,
-    char_set: str,
-) -> list[str]:
+    char_set: "str | bytes | tuple[str, ...]",
+) -> list[bytes]:
     """
-    Like `image_to_ascii`, but each character is wrapped in an ANSI color
-    code sampled from the original (RGB) image.
+    Like `image_to_ascii`, but each character is colored with an ANSI code
+    sampled from the original (RGB) image.  The color code is only emitted
+    when it changes from the previous character, and every row ends with a
+    single reset.
 
     Parameters
     ----------
@@ -475,33 +724,59 @@ def image_to_ascii_colored(
         The original resized image in RGB (or RGBA) mode — used for color sampling.
     gray_img : PIL.Image.Image
         The grayscale version — used for ASCII character selection.
-    char_set : str
-        Ordered string of ASCII characters, darkest to lightest.
+    char_set : str, bytes or tuple
+        Ordered string of characters, darkest to lightest, or the lookup
+        table built from one by `_build_char_lut`.
 
     Returns
     -------
-    list[str]
-        Each element is one row of ANSI-colored ASCII characters.
+    list[bytes]
+        Each element is one row of ANSI-colored characters.
     """
     # Ensure we work in RGB for clean color extraction
-    rgb_img = original_img.convert("RGB")
+    rgb_img  = original_img.convert("RGB")
+    char_lut = _as_char_lut(char_set)
+
+    if np is not None and isinstance(char_lut, bytes):
+        lut  = np.frombuffer(char_lut, dtype=np.uint8)
+        gray = np.asarray(gray_img, dtype=np.uint8)   # (H, W)
+        rgb  = np.asarray(rgb_img, dtype=np.uint8)    # (H, W, 3)
+        # Only large frames are worth importing numba and loading the kernel
+        kernel = _load_colored_kernel() if gray.size >= JIT_MIN_PIXELS else None
+        if kernel is not None:
+            return _ansi_rows_jit(kernel, gray, rgb, lut)
+        return _ansi_rows_parallel(lut[gray], rgb)
 
     width, height = gray_img.size
-    gray_pixels  = list(gray_img.getdata())   # Convert to list to support indexing
-    color_pixels = list(rgb_img.getdata())
+    gray_pixels  = gray_img.tobytes()   # one gray level per pixel
+    color_pixels = rgb_img.tobytes()    # packed R, G, B bytes
+
+    # Encoded character for each gray level (multi-byte for non-ASCII sets)
+    if isinstance(char_lut, bytes):
+        char_bytes = [char_lut[v:v + 1] for v in range(256)]
+    else:
+        char_bytes = [c.encode("utf-8") for c in char_lut]
 
     rows = []
     for row_index in range(height):
         row_start = row_index * width
         row_end   = row_start + width
 
-        ascii_row = ""
+        # Collect the pieces and join once — repeated += copies the whole
+        # row so far on every pixel
+        parts = []
+        prev_color = None
         for col_index in range(row_start, row_end):
-            char  = pixel_to_ascii(gray_pixels[col_index], char_set)
-            r, g, b = color_pixels[col_index]
-            ascii_row += make_ansi_color(r, g, b, char)
+            color = color_pixels[col_index * 3:col_index * 3 + 3]
+            if color != prev_color:
+                # Only switch the foreground when the color actually changes
+                r, g, b = color
+                parts.append(_SGR_PREFIX + _DEC[r] + b";" + _DEC[g] + b";" + _DEC[b] + b"m")
+                prev_color = color
+            parts.append(char_bytes[gray_pixels[col_index]])
 
-        rows.append(ascii_row)
+        parts.append(_SGR_RESET)
+        rows.append(b"".join(parts))
 
     return rows
 
@@ -510,38 +785,58 @@ def image_to_ascii_colored(
 # Output functions
 # ---------------------------------------------------------------------------
 
-def print_ascii(rows: list[str]) -> None:
+def _as_byte_rows(rows: "list[bytes] | list[str]") -> list[bytes]:
+    """Return `rows` as bytes, encoding any str rows as UTF-8."""
+    return [r.encode("utf-8") if isinstance(r, str) else r for r in rows]
+
+
+def print_ascii(rows: "list[bytes] | list[str]") -> None:
     """
     Print the ASCII art rows to the terminal.
 
+    The whole frame is written to the binary stdout buffer in one call, so
+    there is no per-line flushing or text re-encoding.
+
     Parameters
     ----------
-    rows : list[str]
+    rows : list[bytes] or list[str]
         Lines of ASCII (or ANSI-colored ASCII) characters.
     """
-    print("\n".join(rows))
+    payload = b"\n".join(_as_byte_rows(rows)) + b"\n"
+
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Text-only stdout (StringIO, IDLE, notebooks) — write decoded text
+        sys.stdout.write(payload.decode("utf-8"))
+        return
 
+    sys.stdout.flush()   # keep ordering with anything already print()-ed
+    out.write(payload)
+    out.flush()
 
-def save_ascii(rows: list[str], output_path: str) -> None:
+
+def save_ascii(rows: "list[bytes] | list[str]", output_path: str) -> None:
     """
     Save plain ASCII art (no ANSI codes) to a text file.
 
     Parameters
     ----------
-    rows : list[str]
+    rows : list[bytes] or list[str]
         Lines of ASCII characters. ANSI codes are stripped automatically.
     output_path : str
         Destination .txt file path.
     """
-    import re
-    # Strip ANSI escape codes so the saved file is readable in any editor
-    ansi_escape = re.compile(r"\033\[[0-9;]*m")
+    payload = b"\n".join(_as_byte_rows(rows)) + b"\n"
+
+    # Strip ANSI escape codes so the saved file is readable in any editor —
+    # plain output has none, so skip the regex entirely
+    if b"\x1b" in payload:
+        payload = _ANSI_RE.sub(b"", payload)
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for row in rows:
-                clean_row = ansi_escape.sub("", row)
-                f.write(clean_row + "\n")
+        # Rows are already ASCII bytes — write them without a text codec
+        with open(output_path, "wb") as f:
+            f.write(payload)
         print(f"\nASCII art saved to: {output_path}")
     except OSError as exc:
         print(f"Error: Could not write file — {exc}")
@@ -597,6 +892,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional path to save the ASCII art as a .txt file.",
     )
+    parser.add_argument(
+        "--filter", "-f",
+        choices=["auto", *RESAMPLE_FILTERS],
+        default=DEFAULT_FILTER,
+        help=(
+            f"Resampling filter used when resizing (default: {DEFAULT_FILTER}). "
+            f"'auto' picks a faster filter for large downscales."
+        ),
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the image file for corruption before decoding it (slower).",
+    )
     parser.add_argument(
         "--color",
         action="store_true",
@@ -632,13 +941,16 @@ def main() -> None:
         print("Error: --chars must contain at least 2 characters.")
         sys.exit(1)
 
+    # Map all 256 gray levels to characters once, up front
+    char_lut = _build_char_lut(args.chars)
+
     # --- Step 2: Load the image -----------------------------------------------
     print(f"Loading image: {args.image}")
-    img = load_image(args.image)
+    img = load_image(args.image, verify=args.verify)
 
     # --- Step 3: Resize -------------------------------------------------------
     print(f"Resizing to width={args.width} characters …")
-    resized = resize_image(img, args.width)
+    resized = resize_image(img, args.width, args.filter)
 
     # --- Step 3b: Preprocess for detail --------------------------------------
     print("Enhancing detail (sharpness + contrast) …")
@@ -650,10 +962,10 @@ def main() -> None:
     # --- Step 5: Generate ASCII rows -----------------------------------------
     if args.color:
         print("Generating colored ASCII art …\n")
-        rows = image_to_ascii_colored(resized, gray, args.chars)
+        rows = image_to_ascii_colored(resized, gray, char_lut)
     else:
         print("Generating ASCII art …\n")
-        rows = image_to_ascii(gray, args.chars)
+        rows = image_to_ascii(gray, char_lut)
 
     # --- Step 6: Print to terminal -------------------------------------------
     print_ascii(rows)